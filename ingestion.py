@@ -4,37 +4,47 @@ from pathlib import Path
 import chromadb
 from chromadb.config import Settings
 from PyPDF2 import PdfReader
-from sentence_transformers import SentenceTransformer
 
 from rag_anything.anything import parse_document
+from rag_embed import embed, collection_name
 
 PERSIST_DIR = "./data/chroma_db"
 SOURCES_DIR = "./data/sources"
 client = chromadb.PersistentClient(path=PERSIST_DIR)
 
-collection = client.get_or_create_collection("pdf_collection")
-model = SentenceTransformer("all-MiniLM-L6-v2")
+collection = client.get_or_create_collection(collection_name("pdf_collection"))
 
 def ingest_units_to_chroma(units, doc_id_prefix):
+    pending = []
     for unit in units:
         unit_id = f"{doc_id_prefix}_{unit['id']}"
         existing = collection.get(ids=[unit_id])
         if existing.get("ids"):
             print(f"Unit {unit_id} already ingested. Skipping.")
             continue
-        
-        embedding = model.encode([unit["content"]])
-        collection.upsert(
-            ids=[unit_id],
-            documents=[unit["content"]],
-            embeddings=embedding.tolist(),
-            metadatas=[{
-                "docid": doc_id_prefix,
-                "unit_id": unit_id,
-                "modality": unit.get("modality", "unknown")
-            }]
-        )
-        print(f"Ingested unit {unit_id}")
+        pending.append((unit_id, unit))
+
+    # Encode and upsert new units in batches, staying within Chroma's limit.
+    batch_size = client.get_max_batch_size()
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start:start + batch_size]
+        try:
+            embeddings = embed([unit["content"] for _, unit in batch])
+            collection.upsert(
+                ids=[unit_id for unit_id, _ in batch],
+                documents=[unit["content"] for _, unit in batch],
+                embeddings=embeddings,
+                metadatas=[{
+                    "docid": doc_id_prefix,
+                    "unit_id": unit_id,
+                    "modality": unit.get("modality", "unknown")
+                } for unit_id, unit in batch]
+            )
+        except Exception as e:
+            print(f"Failed to ingest units {batch[0][0]} .. {batch[-1][0]}: {e}")
+            raise
+        for unit_id, _ in batch:
+            print(f"Ingested unit {unit_id}")
 
 
 def extract_multimodal_units(file_path: str):
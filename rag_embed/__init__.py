@@ -0,0 +1,16 @@
+from .embedder import (
+    MODEL_NAME,
+    ENCODER_MODES,
+    get_encoder,
+    embed,
+    collection_name,
+)
+
+__all__ = [
+    "MODEL_NAME",
+    "ENCODER_MODES",
+    "get_encoder",
+    "embed",
+    "collection_name",
+]
+
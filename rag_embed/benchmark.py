@@ -0,0 +1,225 @@
+"""
+Compare embedding configurations against the full-precision baseline.
+
+For every encoder mode (float32, int8) and vector format (float32, float16,
+int8) this reports encode throughput, per-query latency, recall@k and the
+bytes per vector the format needs. Ground truth is the exact top-k of the
+float32 encoder with float32 vectors, so the baseline row's recall shows the
+HNSW index's own approximation.
+
+Chroma can only store float32 vectors, so float16/int8 are simulated here:
+vectors are quantized to the format and dequantized before they go into a
+temporary in-memory Chroma collection. Recall therefore reflects the precision
+loss of the format, and latency covers what `retrieve_context` does (query
+encoding plus `collection.query`) but not any speedup a compact store could
+give. int8 uses one symmetric scale calibrated from the corpus vectors and
+applied to queries as well.
+
+The corpus is read from the Chroma collection populated by `ingestion.py`
+(by default the one for the configured EMBEDDING_ENCODER). Queries come from
+`--queries` (one per line) or, by default, from the first sentence of a
+sample of corpus units.
+
+    python -m rag_embed.benchmark --k 4 --num-queries 50
+"""
+
+import argparse
+import random
+import time
+
+import chromadb
+import numpy as np
+from chromadb.errors import ChromaError
+
+from .embedder import ENCODER_MODES, collection_name, get_encoder
+
+PERSIST_DIR = "./data/chroma_db"
+COLLECTION_NAME = "pdf_collection"
+
+VECTOR_FORMATS = ["float32", "float16", "int8"]
+
+# Components of a normalized 384-dim vector are small (mostly well under 0.3),
+# so the int8 range is mapped onto the corpus' own magnitude, ignoring the
+# rarest outliers, which are clipped.
+INT8_CALIBRATION_PERCENTILE = 99.9
+
+
+def load_corpus(persist_dir: str, collection: str) -> list[str] | None:
+    """Read the documents of an existing collection, or None if it does not exist."""
+    client = chromadb.PersistentClient(path=persist_dir)
+    try:
+        coll = client.get_collection(collection)
+    except (ValueError, ChromaError):
+        return None
+    docs = coll.get(include=["documents"])
+    return [doc for doc in docs.get("documents") or [] if doc]
+
+
+def calibrate_int8_scale(vectors: np.ndarray) -> float:
+    """Scale mapping the corpus' component magnitude onto the int8 range."""
+    max_abs = float(np.percentile(np.abs(vectors), INT8_CALIBRATION_PERCENTILE))
+    return 127.0 / max_abs if max_abs > 0 else 1.0
+
+
+def quantize(vectors: np.ndarray, fmt: str, scale: float = 1.0) -> np.ndarray:
+    """Convert float32 vectors to the compact format."""
+    if fmt == "float16":
+        return vectors.astype(np.float16)
+    if fmt == "int8":
+        return np.clip(np.rint(vectors * scale), -127, 127).astype(np.int8)
+    return vectors.astype(np.float32)
+
+
+def dequantize(vectors: np.ndarray, fmt: str, scale: float = 1.0) -> np.ndarray:
+    """Back to float32 for Chroma, keeping the precision loss of the format."""
+    if fmt == "int8":
+        return vectors.astype(np.float32) / scale
+    return vectors.astype(np.float32)
+
+
+def sample_queries(corpus: list[str], n: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    picked = rng.sample(corpus, min(n, len(corpus)))
+    return [doc.split(".")[0].strip()[:200] or doc[:200] for doc in picked]
+
+
+def exact_top_k(doc_vectors: np.ndarray, query_vector: np.ndarray, k: int) -> set[int]:
+    # Squared L2, matching Chroma's default distance.
+    dists = np.einsum("ij,ij->i", doc_vectors, doc_vectors) - 2.0 * doc_vectors @ query_vector
+    k = min(k, len(dists))
+    return set(np.argpartition(dists, k - 1)[:k].tolist())
+
+
+def _fill_collection(client, name: str, vectors: list[list[float]]):
+    coll = client.create_collection(name)
+    batch_size = client.get_max_batch_size()
+    for start in range(0, len(vectors), batch_size):
+        batch = vectors[start:start + batch_size]
+        coll.add(
+            ids=[str(i) for i in range(start, start + len(batch))],
+            embeddings=batch,
+        )
+    return coll
+
+
+def run(corpus: list[str], queries: list[str], k: int, batch_size: int) -> list[dict]:
+    encoded = {}
+    for mode in ENCODER_MODES:
+        encoder = get_encoder(mode)
+        encoder.encode(corpus[:batch_size], batch_size=batch_size)  # warm-up
+        start = time.perf_counter()
+        vectors = encoder.encode(corpus, batch_size=batch_size, convert_to_numpy=True)
+        elapsed = time.perf_counter() - start
+        encoded[mode] = (vectors, len(corpus) / elapsed)
+
+    baseline_vectors = encoded["float32"][0]
+    baseline_encoder = get_encoder("float32")
+    truth = [
+        exact_top_k(baseline_vectors, baseline_encoder.encode(q, convert_to_numpy=True), k)
+        for q in queries
+    ]
+
+    client = chromadb.EphemeralClient()
+    results = []
+    for mode in ENCODER_MODES:
+        encoder = get_encoder(mode)
+        vectors, throughput = encoded[mode]
+        for fmt in VECTOR_FORMATS:
+            scale = calibrate_int8_scale(vectors) if fmt == "int8" else 1.0
+            compact = quantize(vectors, fmt, scale)
+            name = f"benchmark_{mode}_{fmt}"
+            coll = _fill_collection(client, name, dequantize(compact, fmt, scale).tolist())
+            try:
+                encoder.encode(queries[0])  # warm-up
+                latencies, hits = [], 0
+                for query, expected in zip(queries, truth):
+                    start = time.perf_counter()
+                    q_vec = encoder.encode([query], convert_to_numpy=True)
+                    q_vec = dequantize(quantize(q_vec, fmt, scale), fmt, scale)
+                    res = coll.query(
+                        query_embeddings=q_vec.tolist(),
+                        n_results=min(k, len(corpus)),
+                        include=["distances"],
+                    )
+                    latencies.append(time.perf_counter() - start)
+                    hits += len(expected.intersection(int(i) for i in res["ids"][0]))
+            finally:
+                client.delete_collection(name)
+
+            results.append(
+                {
+                    "encoder": mode,
+                    "format": fmt,
+                    "docs_per_s": throughput,
+                    "query_ms_p50": 1000 * float(np.percentile(latencies, 50)),
+                    "query_ms_p95": 1000 * float(np.percentile(latencies, 95)),
+                    "recall": hits / sum(len(t) for t in truth),
+                    # int8 also needs one float32 scale per collection, not per vector.
+                    "bytes_per_vec": compact[0].nbytes,
+                }
+            )
+    return results
+
+
+def print_report(results: list[dict], k: int) -> None:
+    header = (
+        f"{'encoder':<8} {'format':<8} {'docs/s':>8} {'p50 ms':>8} "
+        f"{'p95 ms':>8} {f'recall@{k}':>9} {'bytes/vec':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['encoder']:<8} {r['format']:<8} {r['docs_per_s']:>8.1f} "
+            f"{r['query_ms_p50']:>8.2f} {r['query_ms_p95']:>8.2f} "
+            f"{r['recall']:>9.3f} {r['bytes_per_vec']:>9}"
+        )
+    print(
+        "\nLatency: query encode + Chroma query over float32 vectors. "
+        "bytes/vec: size the format needs; Chroma itself stores float32."
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--persist-dir", default=PERSIST_DIR)
+    parser.add_argument(
+        "--collection",
+        default=collection_name(COLLECTION_NAME),
+        help="Source collection (default: the one for the configured EMBEDDING_ENCODER).",
+    )
+    parser.add_argument("--queries", help="Text file with one query per line.")
+    parser.add_argument("--num-queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    if args.k < 1:
+        parser.error("--k must be at least 1")
+    if args.num_queries < 1:
+        parser.error("--num-queries must be at least 1")
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+
+    queries = None
+    if args.queries:
+        with open(args.queries, encoding="utf-8") as f:
+            queries = [line.strip() for line in f if line.strip()]
+        if not queries:
+            parser.error(f"--queries file '{args.queries}' contains no queries")
+
+    corpus = load_corpus(args.persist_dir, args.collection)
+    if corpus is None:
+        parser.error(f"Collection '{args.collection}' not found in {args.persist_dir}. Run ingestion.py first.")
+    if not corpus:
+        parser.error(f"No documents in collection '{args.collection}'. Run ingestion.py first.")
+
+    if queries is None:
+        queries = sample_queries(corpus, args.num_queries)
+
+    print(f"Corpus: {len(corpus)} units, queries: {len(queries)}, k={args.k}\n")
+    print_report(run(corpus, queries, args.k, args.batch_size), args.k)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import os
+from functools import lru_cache
+
+import torch
+from dotenv import load_dotenv
+from sentence_transformers import SentenceTransformer
+
+# Read .env here as well: ingestion and retrieval build their encoder at import
+# time, before main.py gets a chance to call load_dotenv().
+load_dotenv()
+
+MODEL_NAME = "all-MiniLM-L6-v2"
+
+ENCODER_MODES = ["float32", "int8"]
+
+
+def _check_encoder_mode(mode: str) -> None:
+    if mode not in ENCODER_MODES:
+        raise ValueError(f"Unknown encoder mode: {mode}. Available: {ENCODER_MODES}")
+
+
+EMBEDDING_ENCODER = os.getenv("EMBEDDING_ENCODER", "float32")
+
+# Fail at import: a typo would otherwise create a stray collection and make
+# every later embed() call fail.
+_check_encoder_mode(EMBEDDING_ENCODER)
+
+
+@lru_cache(maxsize=None)
+def get_encoder(mode: str = EMBEDDING_ENCODER) -> SentenceTransformer:
+    """Load the sentence encoder for the given mode (cached per mode).
+
+    Args:
+        mode: "float32" for the full-precision model, or "int8" for a dynamically
+            quantized copy of it (Linear layers in int8, CPU only).
+
+    Returns:
+        SentenceTransformer instance.
+
+    Raises:
+        ValueError: If mode is not in ENCODER_MODES.
+    """
+    _check_encoder_mode(mode)
+
+    if mode == "float32":
+        return SentenceTransformer(MODEL_NAME)
+
+    # The quantized encoder is derived from the locally cached weights; never
+    # reach out to the hub for it.
+    model = SentenceTransformer(MODEL_NAME, device="cpu", local_files_only=True)
+    model.eval()
+    return torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+
+
+def embed(
+    texts: list[str],
+    mode: str = EMBEDDING_ENCODER,
+    batch_size: int = 32,
+) -> list[list[float]]:
+    """Encode texts with the given encoder mode and return vectors ready for Chroma."""
+    vectors = get_encoder(mode).encode(
+        texts, batch_size=batch_size, convert_to_numpy=True
+    )
+    return vectors.tolist()
+
+
+def collection_name(base: str, mode: str = EMBEDDING_ENCODER) -> str:
+    """Collection name for an encoder mode.
+
+    Vectors from different encoders must not be mixed, and ingestion skips
+    units by id, so the int8 encoder gets its own collection (e.g.
+    "pdf_collection_int8").
+
+    Raises:
+        ValueError: If mode is unknown.
+    """
+    _check_encoder_mode(mode)
+
+    if mode == "float32":
+        return base
+    return f"{base}_{mode}"
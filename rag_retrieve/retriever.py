@@ -1,19 +1,19 @@
 import chromadb
-from sentence_transformers import SentenceTransformer
+
+from rag_embed import embed, collection_name
 
 
 PERSIST_DIR = "./data/chroma_db"
 COLLECTION_NAME = "pdf_collection"
 
 _client = chromadb.PersistentClient(path=PERSIST_DIR)
-_collection = _client.get_or_create_collection(COLLECTION_NAME)
-_embedder = SentenceTransformer('all-MiniLM-L6-v2')
+_collection = _client.get_or_create_collection(collection_name(COLLECTION_NAME))
 
 def retrieve_context(query: str, k: int = 4) -> list[dict]:
     try:
         if _collection.count() == 0:
             return []
-        q_emb = _embedder.encode(query).tolist()
+        q_emb = embed([query])[0]
         res = _collection.query(
             query_embeddings=[q_emb],
             n_results=k,